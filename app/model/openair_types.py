@@ -1,5 +1,6 @@
 """OpenAir types and data structures for the Airspace Viewer application."""
 
+from array import array
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Dict, List, Optional, Union
@@ -140,10 +141,15 @@ class PolygonGeometry:
     Attributes:
         type (str): The geometry type, always 'Polygon'.
         segments (Optional[List[PolygonSegment]]): List of polygon segments (Point, Arc, ArcSegment).
+        point_lngs (Optional[array]): Longitudes of the segments as a contiguous
+            float column, set only when every segment is a Point.
+        point_lats (Optional[array]): Latitudes matching point_lngs.
     """
 
     type: str = "Polygon"
     segments: Optional[List[PolygonSegment]] = None
+    point_lngs: Optional[array] = None
+    point_lats: Optional[array] = None
 
     def __post_init__(self):
         """Initializes segments to an empty list if not provided."""
@@ -311,7 +317,23 @@ def convert_raw_airspace(raw_data: Dict[str, Any]) -> Airspace:
                             )
                         )
 
-            return PolygonGeometry(type=geom_type, segments=segments if segments else None)
+            # Pure point rings (no arcs) also get parallel lng/lat columns so
+            # converters can skip per-segment object access
+            point_lngs = point_lats = None
+            points = [seg for seg in segments if isinstance(seg, Point)]
+            if points and len(points) == len(segments):
+                try:
+                    point_lngs = array("d", [point.lng for point in points])
+                    point_lats = array("d", [point.lat for point in points])
+                except TypeError:
+                    point_lngs = point_lats = None
+
+            return PolygonGeometry(
+                type=geom_type,
+                segments=segments if segments else None,
+                point_lngs=point_lngs,
+                point_lats=point_lats,
+            )
 
     return Airspace(
         name=raw_data.get("name", ""),
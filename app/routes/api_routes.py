@@ -3,6 +3,7 @@
 from flask import Blueprint, Response, jsonify
 
 from app.services.airspace_service import get_airspace_service
+from app.utils.json_utils import dumps_json
 
 api_bp = Blueprint("api", __name__, url_prefix="/api")
 
@@ -29,7 +30,7 @@ def get_airspaces():
     """API endpoint to get airspace data as GeoJSON."""
     service = get_airspace_service()
     _, geojson = service.get_cached_data()
-    return jsonify(geojson)
+    return Response(dumps_json(geojson), mimetype="application/json")
 
 
 @api_bp.route("/stats")
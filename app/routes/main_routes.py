@@ -1,6 +1,5 @@
 """Main web routes for the Airspace Viewer Flask application."""
 
-import json
 import os
 
 from flask import (
@@ -22,18 +21,21 @@ from app.utils.airspace_colors import (
     get_legend_data,
 )
 from app.utils.file_utils import allowed_file, cleanup_temp_file, get_secure_filepath
+from app.utils.json_utils import dumps_json
 
 main_bp = Blueprint("main", __name__)
 
+# Resolved once at import instead of on every request
+_EXAMPLES_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../examples"))
+
 
 @main_bp.route("/examples/list")
 def list_examples():
     """Return a list of available example files."""
-    examples_dir = os.path.join(os.path.dirname(__file__), "../examples")
     files = [
         f
-        for f in os.listdir(examples_dir)
-        if os.path.isfile(os.path.join(examples_dir, f))
+        for f in os.listdir(_EXAMPLES_DIR)
+        if os.path.isfile(os.path.join(_EXAMPLES_DIR, f))
     ]
     files.sort()
     return jsonify(files)
@@ -42,9 +44,8 @@ def list_examples():
 @main_bp.route("/examples/get/<filename>")
 def get_example_file(filename):
     """Return the content of the selected example file."""
-    examples_dir = os.path.join(os.path.dirname(__file__), "../examples")
-    safe_path = os.path.normpath(os.path.join(examples_dir, filename))
-    if not safe_path.startswith(os.path.abspath(examples_dir)):
+    safe_path = os.path.normpath(os.path.join(_EXAMPLES_DIR, filename))
+    if not safe_path.startswith(_EXAMPLES_DIR):
         return "Invalid file path", 400
     if not os.path.isfile(safe_path):
         return "File not found", 404
@@ -82,7 +83,7 @@ def js_config():
     template = render_template(
         "js/config.js",
         airspace_colors_js=generate_javascript_colors(),
-        geojson=json.dumps(geojson),
+        geojson=dumps_json(geojson),
     )
     return Response(template, mimetype="application/javascript")
 
@@ -6,12 +6,12 @@ from flask import Blueprint, send_from_directory
 
 static_bp = Blueprint("static_routes", __name__)
 
+_STATIC_DIR = os.path.join(static_bp.root_path, "..", "static")
+
 
 def _serve_static_file(filename, mimetype):
     """Helper function to serve static files."""
-    return send_from_directory(
-        os.path.join(static_bp.root_path, "..", "static"), filename, mimetype=mimetype
-    )
+    return send_from_directory(_STATIC_DIR, filename, mimetype=mimetype)
 
 
 # Favicon and icon routes
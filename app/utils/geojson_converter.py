@@ -5,19 +5,49 @@ It supports conversion of various airspace geometries (polygons, circles, lines)
 """
 
 import math
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from app.model.openair_types import (
+    Altitude,
+    AltitudeType,
     Arc,
     ArcSegment,
     CircleGeometry,
     Point,
     PolygonGeometry,
+    convert_raw_airspace,
 )
 from app.utils.airspace_colors import get_airspace_color
 from app.utils.arc_utils import segment_to_points
+from app.utils.geometry_utils import simplify_ring
 from app.utils.logging_utils import debug_log, error_log, info_log, warning_log
-from app.utils.units import nautical_miles_to_meters
+from app.utils.units import feet_to_meters, nautical_miles_to_meters
+
+
+def _altitude_from_dict(altitude: Dict[str, Any]) -> Altitude:
+    """Convert raw altitude dictionary data to an Altitude object.
+
+    Args:
+        altitude (dict): Raw altitude data with 'type' and 'val' keys.
+
+    Returns:
+        Altitude: The altitude object; unknown types map to AltitudeType.OTHER.
+    """
+    alt_type_str = altitude.get("type", "Gnd")
+    try:
+        alt_type = AltitudeType(alt_type_str)
+    except ValueError:
+        alt_type = AltitudeType.OTHER
+    return Altitude(type=alt_type, val=altitude.get("val"))
+
+
+# Text formatters keyed on the exact altitude input type; any other type is
+# formatted with str()
+_ALTITUDE_TEXT_DISPATCH: Dict[type, Callable[[Any], str]] = {
+    Altitude: Altitude.to_text,
+    # Fallback for raw dictionary data - convert to Altitude object first
+    dict: lambda altitude: _altitude_from_dict(altitude).to_text(),
+}
 
 
 def altitude_to_text(altitude: Any) -> str:
@@ -29,21 +59,7 @@ def altitude_to_text(altitude: Any) -> str:
     Returns:
         str: Human-readable altitude string.
     """
-    from app.model.openair_types import Altitude, AltitudeType
-
-    if isinstance(altitude, Altitude):
-        return altitude.to_text()
-    elif isinstance(altitude, dict):
-        # Fallback for raw dictionary data - convert to Altitude object first
-        alt_type_str = altitude.get("type", "Gnd")
-        try:
-            alt_type = AltitudeType(alt_type_str)
-        except ValueError:
-            alt_type = AltitudeType.OTHER
-        altitude_obj = Altitude(type=alt_type, val=altitude.get("val"))
-        return altitude_obj.to_text()
-    else:
-        return str(altitude)
+    return _ALTITUDE_TEXT_DISPATCH.get(type(altitude), str)(altitude)
 
 
 def altitude_to_numeric(altitude: Any) -> Dict[str, Any]:
@@ -59,16 +75,8 @@ def altitude_to_numeric(altitude: Any) -> Dict[str, Any]:
             "meters" is None when no numeric value can be derived
             (unlimited or unparseable altitudes).
     """
-    from app.model.openair_types import Altitude, AltitudeType
-    from app.utils.units import feet_to_meters
-
     if isinstance(altitude, dict):
-        alt_type_str = altitude.get("type", "Gnd")
-        try:
-            alt_type = AltitudeType(alt_type_str)
-        except ValueError:
-            alt_type = AltitudeType.OTHER
-        altitude = Altitude(type=alt_type, val=altitude.get("val"))
+        altitude = _altitude_from_dict(altitude)
 
     if not isinstance(altitude, Altitude):
         return {"meters": None, "ref": "UNKNOWN"}
@@ -102,49 +110,64 @@ def altitude_to_numeric(altitude: Any) -> Dict[str, Any]:
         return {"meters": None, "ref": "UNKNOWN"}
 
 
-def convert_airspace_to_geojson(airspaces: List[Any]) -> Dict[str, Any]:
+def convert_airspace_to_geojson(
+    airspaces: List[Any], simplify_tolerance: float = 0.0
+) -> Dict[str, Any]:
     """Convert a list of airspace objects or dictionaries to a GeoJSON FeatureCollection.
 
     Args:
         airspaces (list): List of airspace objects or dictionaries.
+        simplify_tolerance (float): If positive, polygon rings are simplified
+            with this tolerance in degrees (requires Shapely). Defaults to 0.
 
     Returns:
         dict: GeoJSON FeatureCollection representing the airspaces.
     """
-    features = []
-    skipped_reasons: dict = {}
-
     info_log("geojson_converter", f"Converting {len(airspaces)} airspaces to GeoJSON")
+    features = []
+    skipped_reasons: Dict[str, int] = {}
     for i, airspace_data in enumerate(airspaces):
         try:
             # Debug: Print processing info
             debug_log(
-                "geojson_converter", f"Processing airspace {i+1}/{len(airspaces)}"
+                "geojson_converter", "Processing airspace %d/%d", i + 1, len(airspaces)
             )
 
             # Convert raw data to typed Airspace object if needed
             if isinstance(airspace_data, dict):
+                if not _has_enough_points(airspace_data):
+                    debug_log(
+                        "geojson_converter",
+                        "  ✗ Skipped airspace '%s' - not enough points for a geometry",
+                        airspace_data.get("name", "Unknown"),
+                    )
+                    skipped_reasons["insufficient-points"] = (
+                        skipped_reasons.get("insufficient-points", 0) + 1
+                    )
+                    continue
                 debug_log(
                     "geojson_converter",
-                    f"  Converting raw dict data with keys: {list(airspace_data.keys())}",
+                    "  Converting raw dict data with keys: %s",
+                    list(airspace_data.keys()),
                 )
-                from app.model.openair_types import convert_raw_airspace
-
                 airspace = convert_raw_airspace(airspace_data)
             else:
                 debug_log(
                     "geojson_converter",
-                    f"  Using existing airspace object of type: {type(airspace_data)}",
+                    "  Using existing airspace object of type: %s",
+                    type(airspace_data),
                 )
                 airspace = airspace_data
 
             # Create feature from airspace
-            feature = _create_geojson_feature(airspace)
+            feature = _create_geojson_feature(airspace, simplify_tolerance)
 
             if feature["geometry"] is not None:
                 debug_log(
                     "geojson_converter",
-                    f"  ✓ Added feature '{airspace.name}' with {feature['geometry']['type']} geometry",
+                    "  ✓ Added feature '%s' with %s geometry",
+                    airspace.name,
+                    feature["geometry"]["type"],
                 )
                 features.append(feature)
             else:
@@ -163,11 +186,41 @@ def convert_airspace_to_geojson(airspaces: List[Any]) -> Dict[str, Any]:
     return {"type": "FeatureCollection", "features": features}
 
 
-def _create_geojson_feature(airspace: Any) -> Dict[str, Any]:
+def _has_enough_points(airspace_data: Dict[str, Any]) -> bool:
+    """Check whether raw airspace data can yield at least a 2-point geometry.
+
+    This is a cheap pre-filter on the raw dictionary, so stub airspaces are
+    rejected before the typed Airspace object is built.
+
+    Args:
+        airspace_data (dict): Raw airspace data as returned by the OpenAir parser.
+
+    Returns:
+        bool: False for polygons without arcs that have fewer than 2 points.
+    """
+    geom = airspace_data.get("geom")
+    if not isinstance(geom, dict):
+        return False
+    if geom.get("type") == "Circle":
+        return True
+    segments = geom.get("segments") or []
+    if len(segments) >= 2:
+        return True
+    # A single arc still interpolates to several points
+    return any(
+        isinstance(seg, dict) and seg.get("type") in ("Arc", "ArcSegment")
+        for seg in segments
+    )
+
+
+def _create_geojson_feature(
+    airspace: Any, simplify_tolerance: float = 0.0
+) -> Dict[str, Any]:
     """Create a GeoJSON feature from an airspace object.
 
     Args:
         airspace: The airspace object to convert.
+        simplify_tolerance (float): Polygon simplification tolerance in degrees.
 
     Returns:
         dict: GeoJSON feature dictionary.
@@ -181,7 +234,9 @@ def _create_geojson_feature(airspace: Any) -> Dict[str, Any]:
 
     debug_log(
         "geojson_converter",
-        f"  Successfully extracted properties: name='{name}', class='{airspace_class}'",
+        "  Successfully extracted properties: name='%s', class='%s'",
+        name,
+        airspace_class,
     )
 
     feature = {
@@ -203,10 +258,12 @@ def _create_geojson_feature(airspace: Any) -> Dict[str, Any]:
 
     # Process geometry
     geom = airspace.geom
-    debug_log("geojson_converter", f"  Geometry type: {type(geom)}")
+    debug_log("geojson_converter", "  Geometry type: %s", type(geom))
 
     if isinstance(geom, PolygonGeometry):
-        feature["geometry"] = _process_polygon_geometry(geom, feature)
+        feature["geometry"] = _process_polygon_geometry(
+            geom, feature, simplify_tolerance
+        )
     elif isinstance(geom, CircleGeometry):
         feature["geometry"] = _process_circle_geometry(geom)
     else:
@@ -218,24 +275,35 @@ def _create_geojson_feature(airspace: Any) -> Dict[str, Any]:
 
 
 def _process_polygon_geometry(
-    geom: PolygonGeometry, feature: Dict[str, Any]
+    geom: PolygonGeometry, feature: Dict[str, Any], simplify_tolerance: float = 0.0
 ) -> Optional[Dict[str, Any]]:
     """Process a PolygonGeometry object and return a GeoJSON geometry.
 
     Args:
         geom (PolygonGeometry): The polygon geometry to process.
         feature (dict): The GeoJSON feature being constructed (for property updates).
+        simplify_tolerance (float): If positive, simplify the polygon ring with
+            this tolerance in degrees.
 
     Returns:
         dict | None: GeoJSON geometry dictionary, or None if invalid.
     """
     segment_count = len(geom.segments) if geom.segments is not None else 0
     debug_log(
-        "geojson_converter", f"  Processing polygon with {segment_count} segments"
+        "geojson_converter", "  Processing polygon with %s segments", segment_count
     )
 
     coordinates: List[List[float]] = []
-    if geom.segments is not None:
+    # Last emitted point, kept as scalars so duplicates are rejected without
+    # allocating a coordinate list for them
+    last_lng = last_lat = None
+    if geom.point_lngs is not None and geom.point_lats is not None:
+        # Pure point ring: read the parallel coordinate columns directly
+        for lng, lat in zip(geom.point_lngs, geom.point_lats):
+            if lng != last_lng or lat != last_lat:
+                coordinates.append([lng, lat])
+                last_lng, last_lat = lng, lat
+    elif geom.segments is not None:
         for segment in geom.segments:
             points = segment_to_points(segment)
             if not points:
@@ -252,18 +320,28 @@ def _process_polygon_geometry(
                     )
                 continue
             for lat, lng in points:
-                coord = [lng, lat]  # GeoJSON uses [lon, lat]
                 # Avoid duplicate points where an arc endpoint repeats the
                 # preceding DP record
-                if not coordinates or coordinates[-1] != coord:
-                    coordinates.append(coord)
+                if lng != last_lng or lat != last_lat:
+                    coordinates.append([lng, lat])  # GeoJSON uses [lon, lat]
+                    last_lng, last_lat = lng, lat
 
-    debug_log("geojson_converter", f"  Extracted {len(coordinates)} coordinate points")
+    debug_log("geojson_converter", "  Extracted %d coordinate points", len(coordinates))
 
     if len(coordinates) > 2:  # Need at least 3 points for a polygon
         # Close the polygon if not already closed
         if coordinates[0] != coordinates[-1]:
             coordinates.append(coordinates[0])
+        if simplify_tolerance > 0:
+            coordinates = [
+                [lng, lat]
+                for lng, lat in simplify_ring(coordinates, simplify_tolerance)
+            ]
+            debug_log(
+                "geojson_converter",
+                "  Simplified polygon to %d coordinate points",
+                len(coordinates),
+            )
         return {"type": "Polygon", "coordinates": [coordinates]}
 
     elif len(coordinates) == 2:
@@ -296,7 +374,9 @@ def _process_circle_geometry(geom: CircleGeometry) -> Optional[Dict[str, Any]]:
     """
     debug_log(
         "geojson_converter",
-        f"  Processing circle with center {geom.centerpoint} and radius {geom.radius}",
+        "  Processing circle with center %s and radius %s",
+        geom.centerpoint,
+        geom.radius,
     )
 
     center_lat = center_lng = None
@@ -322,21 +402,23 @@ def _process_circle_geometry(geom: CircleGeometry) -> Optional[Dict[str, Any]]:
         radius_meters = nautical_miles_to_meters(geom.radius)
         radius_deg = radius_meters / 111320  # meters per degree at equator
 
+        # Longitude degrees shrink with latitude; constant for the whole circle
+        inv_cos_lat = 1.0 / math.cos(math.radians(center_lat))
+
         # Create circle approximation with polygon (36 points)
         coordinates = []
         for i in range(36):  # 36 points for smooth circle
             angle = i * 10 * math.pi / 180  # 10 degrees apart
             lat = center_lat + radius_deg * math.cos(angle)
-            lng = center_lng + radius_deg * math.sin(angle) / math.cos(
-                math.radians(center_lat)
-            )
+            lng = center_lng + radius_deg * math.sin(angle) * inv_cos_lat
             coordinates.append([lng, lat])
 
         # Close the circle
         coordinates.append(coordinates[0])
         debug_log(
             "geojson_converter",
-            f"  ✓ Converted circle to polygon with {len(coordinates)} points",
+            "  ✓ Converted circle to polygon with %d points",
+            len(coordinates),
         )
         return {"type": "Polygon", "coordinates": [coordinates]}
     else:
@@ -367,9 +449,7 @@ def _handle_conversion_error(airspace_data: Any, error: Exception) -> None:
         error_log("geojson_converter", f"  Airspace object type: {type(airspace_data)}")
 
     error_log("geojson_converter", f"  Exception type: {type(error)}")
-    import traceback
-
-    error_log("geojson_converter", f"  Traceback: {traceback.format_exc()}")
+    debug_log("geojson_converter", "  Traceback:", exc_info=True)
 
 
 def _print_conversion_summary(
@@ -0,0 +1,47 @@
+"""Polygon ring utilities.
+
+This module provides optional post-processing of assembled polygon rings
+before they are emitted as GeoJSON or KML, such as removing redundant
+(near-)collinear vertices.
+
+Simplification relies on Shapely, which is an optional dependency; it is only
+required when a positive tolerance is requested. It is imported on first use,
+since loading Shapely (and NumPy) is a large part of application startup.
+"""
+
+from typing import List, Sequence, Tuple
+
+LngLat = Tuple[float, float]
+
+
+def simplify_ring(
+    coordinates: Sequence[Sequence[float]], tolerance: float
+) -> List[LngLat]:
+    """Simplify a closed polygon ring with the Douglas-Peucker algorithm.
+
+    Args:
+        coordinates (sequence): Closed ring of (lng, lat) pairs, first point
+            repeated as the last one.
+        tolerance (float): Maximum allowed deviation in degrees. A tolerance of
+            0 or less returns the ring unchanged.
+
+    Returns:
+        list: Closed ring of (lng, lat) tuples. The input ring is returned
+            unchanged if simplification would collapse it below a triangle.
+
+    Raises:
+        ImportError: If a positive tolerance is given and Shapely is not installed.
+    """
+    ring = [(float(lng), float(lat)) for lng, lat in coordinates]
+    if tolerance <= 0 or len(ring) < 4:
+        return ring
+    try:
+        import shapely  # type: ignore
+    except ImportError:
+        raise ImportError(
+            "shapely is required for polygon simplification. Please install it via pip."
+        ) from None
+    simplified = shapely.LinearRing(ring).simplify(tolerance, preserve_topology=False)
+    if simplified.is_empty or len(simplified.coords) < 4:
+        return ring
+    return [(lng, lat) for lng, lat in simplified.coords]
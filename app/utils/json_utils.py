@@ -0,0 +1,21 @@
+"""JSON serialization utilities.
+
+This module serializes response payloads such as the airspace GeoJSON with
+orjson, which is considerably faster than the standard library json module.
+"""
+
+from typing import Any
+
+import orjson
+
+
+def dumps_json(data: Any) -> str:
+    """Serialize data to a JSON string.
+
+    Args:
+        data (Any): JSON-serializable data (dicts, lists, strings, numbers, ...).
+
+    Returns:
+        str: The JSON document.
+    """
+    return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
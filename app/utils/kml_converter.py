@@ -4,31 +4,81 @@ This module provides utilities to convert airspace data structures into KML form
 It supports conversion of various airspace geometries (polygons, circles, lines) and includes helpers for altitude formatting.
 """
 
+import functools
+import logging
 import math
-from typing import Any, List, Sequence, Tuple
+from typing import Any, Callable, Dict, List, NamedTuple, Sequence, Tuple, cast
 
 try:
     import simplekml  # type: ignore
 except ImportError:
     simplekml = None  # Will raise in function if used without install
-
 from app.model.openair_types import (
+    Altitude,
+    AltitudeType,
     Arc,
     ArcSegment,
     CircleGeometry,
     Point,
     PolygonGeometry,
+    convert_raw_airspace,
 )
 from app.utils.airspace_colors import get_airspace_color
 from app.utils.arc_utils import segment_to_points
-from app.utils.logging_utils import debug_log, error_log, info_log, warning_log
-from app.utils.units import feet_to_meters, nautical_miles_to_meters
+from app.utils.geometry_utils import simplify_ring
+from app.utils.logging_utils import (
+    debug_log,
+    error_log,
+    info_log,
+    warning_log,
+)
+from app.utils.units import FEET_TO_METERS, NM_TO_METERS
+
+_SIMPLEKML_AVAILABLE = simplekml is not None
+
+Ring3D = List[Tuple[float, float, float]]
+
+# Logger used directly in per-segment loops, skipping the logging_utils
+# wrappers. Logging is configured by the info_log call at the start of every
+# conversion, before any of these messages can be emitted.
+_LOG = logging.getLogger("airspace_viewer.kml_converter")
+
+_XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8"?>\n'
+
+_WALL_TEMPLATE = (
+    "<Polygon><extrude>0</extrude><altitudeMode>{mode}</altitudeMode>"
+    "<outerBoundaryIs><LinearRing><coordinates>{coords}</coordinates>"
+    "</LinearRing></outerBoundaryIs></Polygon>"
+)
+
+# Circles are approximated by a polygon whose edges are roughly this long,
+# within the segment count limits below
+CIRCLE_SEGMENT_LENGTH_M = 1000.0
+CIRCLE_MIN_SEGMENTS = 16
+CIRCLE_MAX_SEGMENTS = 256
+
+# Degrees of latitude per meter (spherical approximation, 111320 m per degree)
+_INV_DEG_PER_M = 1.0 / 111320.0
+
+
+def _circle_segment_count(radius_meters: float) -> int:
+    """Number of polygon vertices used to approximate a circle of the given radius."""
+    n = math.ceil(2 * math.pi * radius_meters / CIRCLE_SEGMENT_LENGTH_M)
+    return min(max(n, CIRCLE_MIN_SEGMENTS), CIRCLE_MAX_SEGMENTS)
+
+
+@functools.lru_cache(maxsize=16)
+def _unit_circle(n: int) -> Tuple[Tuple[float, ...], Tuple[float, ...]]:
+    """Return (sin, cos) tables for n evenly spaced bearings starting at north.
+
+    The tables only depend on n, so they are shared by all circles of a similar size.
+    """
+    angles = [i * 2 * math.pi / n for i in range(n)]
+    return tuple(math.sin(a) for a in angles), tuple(math.cos(a) for a in angles)
 
 
 def altitude_to_text(altitude: Any) -> str:
     """Convert an altitude object or dictionary to a human-readable string."""
-    from app.model.openair_types import Altitude, AltitudeType
-
     if isinstance(altitude, Altitude):
         return altitude.to_text()
     elif isinstance(altitude, dict):
@@ -43,9 +93,15 @@ def altitude_to_text(altitude: Any) -> str:
         return str(altitude)
 
 
-def convert_airspace_to_kml(airspaces: List[Any]) -> str:
-    """Convert a list of airspace objects or dictionaries to a KML string."""
-    if simplekml is None:
+def convert_airspace_to_kml(
+    airspaces: List[Any], simplify_tolerance: float = 0.0
+) -> str:
+    """Convert a list of airspace objects or dictionaries to a KML string.
+
+    If simplify_tolerance is positive, polygon rings are simplified with this
+    tolerance in degrees (requires Shapely).
+    """
+    if not _SIMPLEKML_AVAILABLE:
         raise ImportError(
             "simplekml is required for KML export. Please install it via pip."
         )
@@ -53,21 +109,23 @@ def convert_airspace_to_kml(airspaces: List[Any]) -> str:
     info_log("kml_converter", f"Converting {len(airspaces)} airspaces to KML")
     for i, airspace_data in enumerate(airspaces):
         try:
-            debug_log("kml_converter", f"Processing airspace {i+1}/{len(airspaces)}")
+            debug_log(
+                "kml_converter", "Processing airspace %d/%d", i + 1, len(airspaces)
+            )
             if isinstance(airspace_data, dict):
-                from app.model.openair_types import convert_raw_airspace
-
                 airspace = convert_raw_airspace(airspace_data)
             else:
                 airspace = airspace_data
-            _add_kml_feature(kml, airspace)
+            _add_kml_feature(kml, airspace, simplify_tolerance)
         except Exception as e:
             _handle_conversion_error(airspace_data, e)
             continue
-    return str(kml.kml())
+    # Serialize without pretty-printing: simplekml's formatted output re-parses
+    # the whole document into a DOM, which dominates time and peak memory
+    return _XML_DECLARATION + str(kml.kml(format=False))
 
 
-def _add_kml_feature(kml, airspace: Any) -> None:
+def _add_kml_feature(kml, airspace: Any, simplify_tolerance: float = 0.0) -> None:
     name = airspace.name
     airspace_class = airspace.airspace_class
     lower_bound = altitude_to_text(airspace.lower_bound)
@@ -78,7 +136,9 @@ def _add_kml_feature(kml, airspace: Any) -> None:
     color = get_airspace_color(airspace_class)
     geom = airspace.geom
     if isinstance(geom, PolygonGeometry):
-        _add_kml_polygon_3d(kml, airspace, geom, name, description, color)
+        _add_kml_polygon_3d(
+            kml, airspace, geom, name, description, color, simplify_tolerance
+        )
     elif isinstance(geom, CircleGeometry):
         _add_kml_circle_3d(kml, airspace, geom, name, description, color)
     else:
@@ -86,7 +146,13 @@ def _add_kml_feature(kml, airspace: Any) -> None:
 
 
 def _add_kml_polygon_3d(
-    kml, airspace: Any, geom: PolygonGeometry, name: str, description: str, color: str
+    kml,
+    airspace: Any,
+    geom: PolygonGeometry,
+    name: str,
+    description: str,
+    color: str,
+    simplify_tolerance: float = 0.0,
 ) -> None:
     """Create a 3D representation of a polygon airspace.
 
@@ -95,23 +161,29 @@ def _add_kml_polygon_3d(
 
     If the lower bound is above ground, we build a MultiGeometry with a top face, a bottom
     face, and side walls (rectangular polygons for each edge) between lower and upper.
+
+    If simplify_tolerance is positive, the ring is simplified first, which also
+    reduces the number of side walls.
     """
     ring2d: List[Tuple[float, float]] = []
-    if geom.segments is not None:
+    if geom.point_lngs is not None and geom.point_lats is not None:
+        # Pure point ring: read the parallel coordinate columns directly
+        for coord in zip(geom.point_lngs, geom.point_lats):
+            if not ring2d or ring2d[-1] != coord:
+                ring2d.append(coord)
+    elif geom.segments is not None:
         for segment in geom.segments:
             points = segment_to_points(segment)
             if not points:
+                if not _LOG.isEnabledFor(logging.WARNING):
+                    continue
                 if isinstance(segment, (Point, Arc, ArcSegment)):
-                    warning_log(
-                        "kml_converter",
-                        f"{type(segment).__name__} segment produced no points"
-                        " (malformed data?) - skipping",
+                    _LOG.warning(
+                        "%s segment produced no points (malformed data?) - skipping",
+                        type(segment).__name__,
                     )
                 else:
-                    warning_log(
-                        "kml_converter",
-                        f"Unknown segment type: {type(segment).__name__}",
-                    )
+                    _LOG.warning("Unknown segment type: %s", type(segment).__name__)
                 continue
             for lat, lng in points:
                 coord = (lng, lat)
@@ -131,9 +203,13 @@ def _add_kml_polygon_3d(
     if len(ring2d) >= 3 and ring2d[0] != ring2d[-1]:
         ring2d.append(ring2d[0])
 
+    if simplify_tolerance > 0 and len(ring2d) >= 3:
+        ring2d = simplify_ring(ring2d, simplify_tolerance)
+
     # Determine altitude parameters
-    lower_mode, lower_m = _altitude_to_kml(airspace.lower_bound)
-    upper_mode, upper_m = _altitude_to_kml(airspace.upper_bound)
+    lower_mode, lower_m, upper_mode, upper_m, lower_is_ground = _resolve_bounds(
+        airspace
+    )
 
     # If 2-point "polygon" -> treat as LineString obstacle (keep 2D but with extrude if useful)
     if len(ring2d) == 2:
@@ -142,7 +218,7 @@ def _add_kml_polygon_3d(
         return
 
     # Decide strategy
-    lower_is_ground = _is_ground_lower(airspace.lower_bound)
+    kml_color = _hex_to_kml_color(color)
 
     if lower_is_ground:
         # Single extruded polygon to ground at upper altitude
@@ -152,40 +228,28 @@ def _add_kml_polygon_3d(
         )
         pol.extrude = 1
         pol.altitudemode = upper_mode
-        pol.style.polystyle.color = _hex_to_kml_color(color)
+        pol.style.polystyle.color = kml_color
     else:
         # Build a MultiGeometry solid between lower and upper altitudes
         mg = kml.newmultigeometry(name=name, description=description)
 
+        top_coords, bottom_coords, wall_coords = _assemble_3d(ring2d, lower_m, upper_m)
+
         # Top face
-        top_coords = _ring_with_altitude(ring2d, upper_m)
         top = mg.newpolygon(outerboundaryis=top_coords)
         top.altitudemode = upper_mode
         top.extrude = 0
-        top.style.polystyle.color = _hex_to_kml_color(color)
+        top.style.polystyle.color = kml_color
 
         # Bottom face
-        bottom_coords = _ring_with_altitude(ring2d, lower_m)
         bottom = mg.newpolygon(outerboundaryis=bottom_coords)
         bottom.altitudemode = lower_mode
         bottom.extrude = 0
-        bottom.style.polystyle.color = _hex_to_kml_color(color)
-
-        # Side walls for each edge in the ring
-        edges = _iter_edges(ring2d)
-        for (lon1, lat1), (lon2, lat2) in edges:
-            wall_coords = [
-                (lon1, lat1, lower_m),
-                (lon2, lat2, lower_m),
-                (lon2, lat2, upper_m),
-                (lon1, lat1, upper_m),
-                (lon1, lat1, lower_m),
-            ]
-            wall = mg.newpolygon(outerboundaryis=wall_coords)
-            # Use the same mode as the top face (both faces are absolute or relative)
-            wall.altitudemode = upper_mode
-            wall.extrude = 0
-            wall.style.polystyle.color = _hex_to_kml_color(color)
+        bottom.style.polystyle.color = kml_color
+
+        # Side walls for each edge in the ring; use the same mode as the top
+        # face (both faces are absolute or relative)
+        _add_kml_walls(mg, wall_coords, upper_mode)
 
 
 def _add_kml_circle_3d(
@@ -209,22 +273,22 @@ def _add_kml_circle_3d(
         and isinstance(center_lng, (int, float))
         and geom.radius > 0
     ):
-        radius_meters = nautical_miles_to_meters(geom.radius)
-        radius_deg = radius_meters / 111320
-        coordinates: List[Tuple[float, float]] = []
-        for i in range(36):
-            angle = i * 10 * math.pi / 180
-            lat = center_lat + radius_deg * math.cos(angle)
-            lng = center_lng + radius_deg * math.sin(angle) / math.cos(
-                math.radians(center_lat)
-            )
-            coordinates.append((lng, lat))
+        radius_meters = float(geom.radius) * NM_TO_METERS
+        # Radius in degrees; longitude degrees shrink with latitude
+        lat_scale = radius_meters * _INV_DEG_PER_M
+        lng_scale = lat_scale / math.cos(math.radians(center_lat))
+        circle_sin, circle_cos = _unit_circle(_circle_segment_count(radius_meters))
+        coordinates: List[Tuple[float, float]] = [
+            (center_lng + lng_scale * sin_val, center_lat + lat_scale * cos_val)
+            for sin_val, cos_val in zip(circle_sin, circle_cos)
+        ]
         if coordinates[0] != coordinates[-1]:
             coordinates.append(coordinates[0])
 
-        lower_mode, lower_m = _altitude_to_kml(airspace.lower_bound)
-        upper_mode, upper_m = _altitude_to_kml(airspace.upper_bound)
-        lower_is_ground = _is_ground_lower(airspace.lower_bound)
+        lower_mode, lower_m, upper_mode, upper_m, lower_is_ground = _resolve_bounds(
+            airspace
+        )
+        kml_color = _hex_to_kml_color(color)
 
         if lower_is_ground:
             coords_top = _ring_with_altitude(coordinates, upper_m)
@@ -233,35 +297,23 @@ def _add_kml_circle_3d(
             )
             pol.extrude = 1
             pol.altitudemode = upper_mode
-            pol.style.polystyle.color = _hex_to_kml_color(color)
+            pol.style.polystyle.color = kml_color
         else:
             mg = kml.newmultigeometry(name=name, description=description)
+            top_coords, bottom_coords, wall_coords = _assemble_3d(
+                coordinates, lower_m, upper_m
+            )
 
             # Top and bottom
-            top = mg.newpolygon(
-                outerboundaryis=_ring_with_altitude(coordinates, upper_m)
-            )
+            top = mg.newpolygon(outerboundaryis=top_coords)
             top.altitudemode = upper_mode
-            top.style.polystyle.color = _hex_to_kml_color(color)
-            bottom = mg.newpolygon(
-                outerboundaryis=_ring_with_altitude(coordinates, lower_m)
-            )
+            top.style.polystyle.color = kml_color
+            bottom = mg.newpolygon(outerboundaryis=bottom_coords)
             bottom.altitudemode = lower_mode
-            bottom.style.polystyle.color = _hex_to_kml_color(color)
+            bottom.style.polystyle.color = kml_color
 
             # Side walls
-            for (lon1, lat1), (lon2, lat2) in _iter_edges(coordinates):
-                wall_coords = [
-                    (lon1, lat1, lower_m),
-                    (lon2, lat2, lower_m),
-                    (lon2, lat2, upper_m),
-                    (lon1, lat1, upper_m),
-                    (lon1, lat1, lower_m),
-                ]
-                wall = mg.newpolygon(outerboundaryis=wall_coords)
-                wall.altitudemode = upper_mode
-                wall.extrude = 0
-                wall.style.polystyle.color = _hex_to_kml_color(color)
+            _add_kml_walls(mg, wall_coords, upper_mode)
     else:
         error_log(
             "kml_converter",
@@ -269,6 +321,7 @@ def _add_kml_circle_3d(
         )
 
 
+@functools.lru_cache(maxsize=128)
 def _hex_to_kml_color(hex_color: str) -> str:
     """Convert #RRGGBB or #AARRGGBB to KML aabbggrr format (default alpha=ff)."""
     hex_color = hex_color.lstrip("#")
@@ -287,6 +340,47 @@ def _hex_to_kml_color(hex_color: str) -> str:
 
 # -------------------------- Altitude helpers (3D) ---------------------------
 
+VERY_HIGH_ALT = 60000.0  # meters: visualization only
+
+
+def _alt_other(val: float) -> Tuple[str, float]:
+    return "absolute", 0.0
+
+
+# (altitudeMode, meters) per altitude type, given the numeric altitude value
+_ALT_HANDLERS: Dict[AltitudeType, Callable[[float], Tuple[str, float]]] = {
+    AltitudeType.GND: lambda val: ("relativeToGround", 0.0),
+    AltitudeType.FEET_AMSL: lambda val: ("absolute", val * FEET_TO_METERS),
+    AltitudeType.FEET_AGL: lambda val: ("relativeToGround", val * FEET_TO_METERS),
+    # FL is hundreds of feet (e.g. FL75 => 7500 ft)
+    AltitudeType.FLIGHT_LEVEL: lambda val: ("absolute", val * 100.0 * FEET_TO_METERS),
+    AltitudeType.UNLIMITED: lambda val: ("absolute", VERY_HIGH_ALT),
+}
+
+
+class _ResolvedBounds(NamedTuple):
+    """KML altitude parameters of both bounds of an airspace."""
+
+    lower_mode: str
+    lower_m: float
+    upper_mode: str
+    upper_m: float
+    lower_is_ground: bool
+
+
+def _parse_altitude(altitude: Any) -> Tuple[AltitudeType, float]:
+    """Return (altitude type, numeric value) for an Altitude, dict, or other object."""
+    if isinstance(altitude, Altitude):
+        return altitude.type, _to_float_safe(altitude.val)
+    if isinstance(altitude, dict):
+        try:
+            alt_type = AltitudeType(altitude.get("type", "Gnd"))
+        except Exception:
+            alt_type = AltitudeType.OTHER
+        return alt_type, _to_float_safe(altitude.get("val"))
+    # Unknown object, assume ground
+    return AltitudeType.GND, 0.0
+
 
 def _altitude_to_kml(altitude: Any) -> Tuple[str, float]:
     """Return (altitudeMode, meters) for a given Altitude.
@@ -298,77 +392,23 @@ def _altitude_to_kml(altitude: Any) -> Tuple[str, float]:
     - UNLIMITED => (simplekml.AltitudeMode.absolute, VERY_HIGH_ALT)
     - OTHER/unknown => (simplekml.AltitudeMode.absolute, 0.0)
     """
-    from app.model.openair_types import Altitude as OAAltitude
+    alt_type, val = _parse_altitude(altitude)
+    return _ALT_HANDLERS.get(alt_type, _alt_other)(val)
 
-    VERY_HIGH_ALT = 60000.0  # meters: visualization only
 
-    if isinstance(altitude, OAAltitude):
-        alt_type = altitude.type
-        val = altitude.val
-    elif isinstance(altitude, dict):
-        try:
-            from app.model.openair_types import AltitudeType as AT
+def _resolve_bounds(airspace: Any) -> _ResolvedBounds:
+    """Resolve both bounds of an airspace, parsing the lower bound only once.
 
-            alt_type = AT(altitude.get("type", "Gnd"))
-        except Exception:
-            from app.model.openair_types import AltitudeType as AT
-
-            alt_type = AT.OTHER
-        val = altitude.get("val")
-    else:
-        # Unknown object, assume ground
-        from app.model.openair_types import AltitudeType as AT
-
-        alt_type = AT.GND
-        val = 0
-
-    if alt_type.name in ("GND",):
-        return "relativeToGround", 0.0
-    if alt_type.name == "FEET_AMSL":
-        meters = float(feet_to_meters(_to_float_safe(val)))
-        return "absolute", meters
-    if alt_type.name == "FEET_AGL":
-        meters = float(feet_to_meters(_to_float_safe(val)))
-        return "relativeToGround", meters
-    if alt_type.name == "FLIGHT_LEVEL":
-        # FL is hundreds of feet (e.g. FL75 => 7500 ft)
-        fl = _to_float_safe(val)
-        meters = float(feet_to_meters(fl * 100.0))
-        return "absolute", meters
-    if alt_type.name == "UNLIMITED":
-        return "absolute", VERY_HIGH_ALT
-    # OTHER/unknown
-    return "absolute", 0.0
-
-
-def _is_ground_lower(altitude: Any) -> bool:
-    """True if lower bound effectively touches ground (for extrude-to-ground)."""
-    from app.model.openair_types import Altitude as OAAltitude
-    from app.model.openair_types import AltitudeType
-
-    if isinstance(altitude, OAAltitude):
-        if altitude.type == AltitudeType.GND:
-            return True
-        if altitude.type == AltitudeType.FEET_AGL:
-            try:
-                return float(_to_float_safe(altitude.val)) <= 0.0
-            except Exception:
-                return True
-        return False
-    if isinstance(altitude, dict):
-        try:
-            t = AltitudeType(altitude.get("type", "Gnd"))  # type: ignore[name-defined]
-        except Exception:
-            return False
-        if t == AltitudeType.GND:
-            return True
-        if t == AltitudeType.FEET_AGL:
-            try:
-                return float(_to_float_safe(altitude.get("val"))) <= 0.0
-            except Exception:
-                return True
-        return False
-    return True
+    The lower bound effectively touches ground (for extrude-to-ground) when it
+    is GND or AGL <= 0.
+    """
+    lower_type, lower_val = _parse_altitude(airspace.lower_bound)
+    lower_mode, lower_m = _ALT_HANDLERS.get(lower_type, _alt_other)(lower_val)
+    upper_mode, upper_m = _altitude_to_kml(airspace.upper_bound)
+    lower_is_ground = lower_type == AltitudeType.GND or (
+        lower_type == AltitudeType.FEET_AGL and lower_val <= 0.0
+    )
+    return _ResolvedBounds(lower_mode, lower_m, upper_mode, upper_m, lower_is_ground)
 
 
 def _ring_with_altitude(
@@ -377,18 +417,65 @@ def _ring_with_altitude(
     return [(lon, lat, float(altitude_m)) for lon, lat in ring2d]
 
 
-def _iter_edges(
-    ring2d: Sequence[Tuple[float, float]],
-) -> List[Tuple[Tuple[float, float], Tuple[float, float]]]:
-    edges: List[Tuple[Tuple[float, float], Tuple[float, float]]] = []
-    if len(ring2d) < 2:
-        return edges
-    for i in range(len(ring2d) - 1):
-        edges.append((ring2d[i], ring2d[i + 1]))
-    return edges
+def _assemble_3d(
+    ring2d: Sequence[Tuple[float, float]], lower_m: float, upper_m: float
+) -> Tuple[Ring3D, Ring3D, List[str]]:
+    """Build the top and bottom rings and the side wall coordinates of a solid.
+
+    All three are produced in a single pass over ring2d. Each vertex is
+    formatted once per altitude and the text is shared by the two walls
+    adjacent to it.
+
+    Returns:
+        tuple: (top ring, bottom ring, KML coordinates text of each wall)
+    """
+    lower_m = float(lower_m)
+    upper_m = float(upper_m)
+    top: Ring3D = []
+    bottom: Ring3D = []
+    lower_text: List[str] = []
+    upper_text: List[str] = []
+    for lon, lat in ring2d:
+        top.append((lon, lat, upper_m))
+        bottom.append((lon, lat, lower_m))
+        lower_text.append(f"{lon},{lat},{lower_m}")
+        upper_text.append(f"{lon},{lat},{upper_m}")
+    # Each wall runs lower edge, up the far side, back along the upper edge
+    walls = [
+        f"{lower1} {lower2} {upper2} {upper1} {lower1}"
+        for lower1, lower2, upper1, upper2 in zip(
+            lower_text, lower_text[1:], upper_text, upper_text[1:]
+        )
+    ]
+    return top, bottom, walls
+
+
+def _add_kml_walls(mg, wall_coords: Sequence[str], mode: str) -> None:
+    """Append side walls, given as KML coordinates text, to a simplekml MultiGeometry.
+
+    Walls only differ by their coordinates, so they are rendered from
+    _WALL_TEMPLATE instead of creating one simplekml Polygon per wall. They
+    inherit the placemark style set on the top and bottom faces.
+    simplekml serializes MultiGeometry members with str(), so the rendered
+    markup is appended to its geometry list as a plain string. That list is
+    the private MultiGeometry._geometries, which is why pyproject.toml pins
+    simplekml below 1.4.
+    """
+    mg._geometries.append(
+        "".join(
+            _WALL_TEMPLATE.format(mode=mode, coords=coords) for coords in wall_coords
+        )
+    )
 
 
 def _to_float_safe(val: Any) -> float:
+    # Exact type checks first: parsed altitude values are almost always plain
+    # floats or ints
+    val_type = type(val)
+    if val_type is float:
+        return cast(float, val)
+    if val_type is int:
+        return float(val)
     try:
         if val is None:
             return 0.0
@@ -400,16 +487,21 @@ def _to_float_safe(val: Any) -> float:
 
 
 def _handle_conversion_error(airspace_data: Any, error: Exception) -> None:
+    # The raw data keys and the traceback are debug details, like in
+    # geojson_converter; debug_log only renders them when debug logging is on
     if isinstance(airspace_data, dict):
         name = airspace_data.get("name", "Unknown")
         error_log("kml_converter", f"Error processing airspace {name}: {error}")
-        error_log(
-            "kml_converter", f"  Raw airspace data keys: {list(airspace_data.keys())}"
+        debug_log(
+            "kml_converter",
+            "  Raw airspace data keys: %s",
+            list(airspace_data.keys()),
         )
     else:
         name = getattr(airspace_data, "name", "Unknown")
-        error_log("kml_converter", f"Error processing airspace {name}: {error}")
-        error_log("kml_converter", f"  Airspace object type: {type(airspace_data)}")
-    import traceback
-
-    error_log("kml_converter", f"  Traceback: {traceback.format_exc()}")
+        error_log(
+            "kml_converter",
+            f"Error processing airspace {name}: {error}\n"
+            f"  Airspace object type: {type(airspace_data)}",
+        )
+    debug_log("kml_converter", "  Traceback:", exc_info=True)
@@ -4,9 +4,10 @@ This module provides a simple, consistent way to control debug logging across
 all modules without verbose parameters or complex configurations.
 """
 
+import functools
 import logging
 import os
-from typing import Optional
+from typing import Any, Optional
 
 # Module-level logger instance
 
@@ -14,9 +15,13 @@ _logger: Optional[logging.Logger] = None
 _debug_enabled: bool = False
 
 
+@functools.lru_cache(maxsize=None)
 def get_logger(module_name: str) -> logging.Logger:
     """Get a debug logger for a specific module.
 
+    Loggers are cached per module name, so the logger name is only built and
+    looked up once.
+
     Args:
         module_name (str): The name of the module requesting the logger.
 
@@ -93,45 +98,59 @@ def set_debug_enabled(enabled: bool) -> None:
                 child_logger.setLevel(logging.DEBUG if enabled else logging.WARNING)
 
 
-def debug_log(module_name: str, message: str) -> None:
+def debug_log(
+    module_name: str, message: str, *args: Any, exc_info: bool = False
+) -> None:
     """Log a debug message for a specific module.
 
     Args:
         module_name (str): The name of the module logging the message.
-        message (str): The debug message to log.
+        message (str): The debug message to log, optionally a %-format string.
+        *args: Arguments merged into message with %-formatting, only when the
+            record is emitted.
+        exc_info (bool): If True, attach the exception currently being handled.
+            The traceback is only rendered when debug logging is enabled.
     """
+    if _logger is not None and not _debug_enabled:
+        return
     logger = get_logger(module_name)
-    logger.debug(message)
+    logger.debug(message, *args, exc_info=exc_info)
 
 
-def info_log(module_name: str, message: str) -> None:
+def info_log(module_name: str, message: str, *args: Any) -> None:
     """Log an info message for a specific module.
 
     Args:
         module_name (str): The name of the module logging the message.
-        message (str): The info message to log.
+        message (str): The info message to log, optionally a %-format string.
+        *args: Arguments merged into message with %-formatting, only when the
+            record is emitted.
     """
     logger = get_logger(module_name)
-    logger.info(message)
+    logger.info(message, *args)
 
 
-def error_log(module_name: str, message: str) -> None:
+def error_log(module_name: str, message: str, *args: Any) -> None:
     """Log an error message for a specific module.
 
     Args:
         module_name (str): The name of the module logging the message.
-        message (str): The error message to log.
+        message (str): The error message to log, optionally a %-format string.
+        *args: Arguments merged into message with %-formatting, only when the
+            record is emitted.
     """
     logger = get_logger(module_name)
-    logger.error(message)
+    logger.error(message, *args)
 
 
-def warning_log(module_name: str, message: str) -> None:
+def warning_log(module_name: str, message: str, *args: Any) -> None:
     """Log a warning message for a specific module.
 
     Args:
         module_name (str): The name of the module logging the message.
-        message (str): The warning message to log.
+        message (str): The warning message to log, optionally a %-format string.
+        *args: Arguments merged into message with %-formatting, only when the
+            record is emitted.
     """
     logger = get_logger(module_name)
-    logger.warning(message)
+    logger.warning(message, *args)
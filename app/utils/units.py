@@ -11,12 +11,19 @@ Functions:
     meters_to_statute_miles(meters): Convert meters to statute miles.
     kilometers_to_meters(km): Convert kilometers to meters.
     meters_to_kilometers(meters): Convert meters to kilometers.
+
+Constants:
+    FEET_TO_METERS: Meters per foot, for inline conversion in hot loops.
+    NM_TO_METERS: Meters per nautical mile, for inline conversion in hot loops.
 """
 
 from typing import Union
 
 Number = Union[int, float]
 
+FEET_TO_METERS = 0.3048
+NM_TO_METERS = 1852.0
+
 
 def feet_to_meters(feet: Number) -> float:
     """Convert feet to meters.
@@ -27,7 +34,7 @@ def feet_to_meters(feet: Number) -> float:
     Returns:
         float: The value converted to meters.
     """
-    return float(feet) * 0.3048
+    return float(feet) * FEET_TO_METERS
 
 
 def meters_to_feet(meters: Number) -> float:
@@ -39,7 +46,7 @@ def meters_to_feet(meters: Number) -> float:
     Returns:
         float: The value converted to feet.
     """
-    return float(meters) / 0.3048
+    return float(meters) / FEET_TO_METERS
 
 
 def nautical_miles_to_meters(nm: Number) -> float:
@@ -51,7 +58,7 @@ def nautical_miles_to_meters(nm: Number) -> float:
     Returns:
         float: The value converted to meters.
     """
-    return float(nm) * 1852
+    return float(nm) * NM_TO_METERS
 
 
 def meters_to_nautical_miles(meters: Number) -> float:
@@ -63,7 +70,7 @@ def meters_to_nautical_miles(meters: Number) -> float:
     Returns:
         float: The value converted to nautical miles.
     """
-    return float(meters) / 1852
+    return float(meters) / NM_TO_METERS
 
 
 def statute_miles_to_meters(miles: Number) -> float:
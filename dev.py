@@ -0,0 +1,32 @@
+"""Development entry point for the Airspace Viewer application.
+
+Runs the Flask development server with the development configuration and logs a test
+message at each level to check the logging setup. Production servers use application.py.
+"""
+
+from app import create_app
+from app.utils.logging_utils import (
+    debug_log,
+    error_log,
+    info_log,
+    warning_log,
+)
+
+
+def main() -> None:
+    """Create the development application and run the Flask development server."""
+    application = create_app("development")
+
+    print("Running in development mode")
+
+    # Log test messages after debug logging is enabled
+    debug_log("application", "This is a debug message")
+    info_log("application", "Airspace service initialized successfully")
+    error_log("application", "This is an error message")
+    warning_log("application", "This is a warning message")
+
+    application.run(host="0.0.0.0", port=8000)
+
+
+if __name__ == "__main__":
+    main()
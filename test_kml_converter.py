@@ -1,17 +1,49 @@
-from openair import parse_file
-
-from app.model.openair_types import convert_raw_airspace
-from app.utils.kml_converter import convert_airspace_to_kml
+import os
+import pickle
 
 # Use a real OpenAir file
 example_file = "app/examples/Airspace-Disentis-2025-MIL-OFF-min-2.txt"
 
-# Parse the OpenAir file to get raw airspace dicts
-raw_airspaces = parse_file(example_file)
 
-# Convert raw dicts to Airspace objects
-airspace_objs = [convert_raw_airspace(raw) for raw in raw_airspaces]
+# Parsed files are cached here, outside app/ so they are never served as examples
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+
+
+def load_raw_airspaces(path):
+    """Parse an OpenAir file, reusing a pickled result while the file is unchanged."""
+    cache = os.path.join(CACHE_DIR, os.path.basename(path) + ".pkl")
+    if os.path.exists(cache) and os.path.getmtime(cache) >= os.path.getmtime(path):
+        try:
+            with open(cache, "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            pass  # Unreadable or incompatible cache: parse the file again
+    from openair import parse_file
+
+    raw_airspaces = parse_file(path)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(cache, "wb") as f:
+            pickle.dump(raw_airspaces, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass  # Caching is optional
+    return raw_airspaces
+
+
+def main():
+    from app.model.openair_types import convert_raw_airspace
+    from app.utils.kml_converter import convert_airspace_to_kml
+
+    # Parse the OpenAir file to get raw airspace dicts
+    raw_airspaces = load_raw_airspaces(example_file)
+
+    # Convert raw dicts to Airspace objects
+    airspace_objs = [convert_raw_airspace(raw) for raw in raw_airspaces]
+
+    # Convert to KML
+    kml_str = convert_airspace_to_kml(airspace_objs)
+    print(kml_str)
+
 
-# Convert to KML
-kml_str = convert_airspace_to_kml(airspace_objs)
-print(kml_str)
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Report the slowest imports from a ``python -X importtime`` log.
+
+Usage:
+    python -X importtime -c "import app.routes.main_routes, app.routes.api_routes, app.routes.static_routes" 2> importtime.log
+    python tools/topn_imports.py importtime.log --top 15 --max-self-ms 100
+
+Modules are listed by self time (time spent in the module body, excluding its
+own imports) along with their cumulative time. The script exits with status 1
+if any module's self time exceeds the threshold, so it can gate a build.
+"""
+
+import argparse
+import sys
+from typing import List, NamedTuple
+
+
+class ImportTime(NamedTuple):
+    """Timing of a single module import, in microseconds."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def parse_importtime(lines: List[str]) -> List[ImportTime]:
+    """Parse the "import time:" lines written by ``python -X importtime``.
+
+    Args:
+        lines (list): Lines of the importtime log; other lines are ignored.
+
+    Returns:
+        list: One ImportTime per imported module.
+    """
+    timings = []
+    for line in lines:
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # Header line
+        timings.append(ImportTime(fields[2].strip(), int(fields[0]), int(fields[1])))
+    return timings
+
+
+def main() -> int:
+    """Print the slowest imports and check them against the threshold."""
+    parser = argparse.ArgumentParser(description="Report the slowest imports.")
+    parser.add_argument("log", help="stderr output of python -X importtime")
+    parser.add_argument("--top", type=int, default=15, help="number of modules to list")
+    parser.add_argument(
+        "--max-self-ms",
+        type=float,
+        default=100.0,
+        help="fail if any module's self time exceeds this many milliseconds",
+    )
+    args = parser.parse_args()
+
+    with open(args.log, encoding="utf-8") as f:
+        timings = parse_importtime(f.readlines())
+    if not timings:
+        print(f"No import timings found in {args.log}", file=sys.stderr)
+        return 1
+
+    timings.sort(key=lambda t: t.self_us, reverse=True)
+    print(f"{'self [ms]':>10} {'cumulative [ms]':>16}  module")
+    for timing in timings[: args.top]:
+        print(
+            f"{timing.self_us / 1000:10.1f} {timing.cumulative_us / 1000:16.1f}"
+            f"  {timing.module}"
+        )
+
+    slow = [t for t in timings if t.self_us / 1000 > args.max_self_ms]
+    for timing in slow:
+        print(
+            f"{timing.module} takes {timing.self_us / 1000:.1f} ms to import"
+            f" (limit {args.max_self_ms:.0f} ms)",
+            file=sys.stderr,
+        )
+    return 1 if slow else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())